@@ -1,20 +1,62 @@
 # config_loader.py
 
+from functools import lru_cache
 from typing import Dict
 import csv
-import yaml
+import os
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:  # no TOML parser; load_config falls back to YAML
+        tomllib = None
 
-def load_config(path: str = "config.yaml") -> Dict:
-    """Load configuration values from a YAML file."""
-    with open(path, "r", encoding="utf-8") as f:
-        cfg = yaml.safe_load(f) or {}
+
+def load_config(path: str = "config.toml") -> Dict:
+    """
+    Load configuration values from a TOML file.
+
+    Legacy .yaml/.yml configs are still accepted; PyYAML is only
+    imported when one is actually used. Without a TOML parser
+    (Python < 3.11 and no tomli), a .toml path falls back to the
+    .yaml file next to it, e.g. config.toml -> config.yaml.
+
+    Parsed results are cached per (path, mtime), so repeated calls
+    only re-read the file after it changes.
+    """
+    if tomllib is None and not path.endswith((".yaml", ".yml")):
+        yaml_path = os.path.splitext(path)[0] + ".yaml"
+        if not os.path.exists(yaml_path):
+            raise RuntimeError(
+                f"Reading {path} needs Python 3.11+ or the tomli package; "
+                f"alternatively put the same settings in {yaml_path}."
+            )
+        path = yaml_path
+
+    mtime_ns = os.stat(path).st_mtime_ns
+    return dict(_load_config_cached(path, mtime_ns))
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict:
+    # mtime_ns is only part of the cache key
+    if path.endswith((".yaml", ".yml")):
+        import yaml
+
+        with open(path, "r", encoding="utf-8") as f:
+            cfg = yaml.safe_load(f) or {}
+    else:
+        with open(path, "rb") as f:
+            cfg = tomllib.load(f)
 
     return {
         "NUM_ROUNDS": cfg.get("num_rounds", 5),
         "ENABLE_RANDOM_TABLE_RANDOMIZATION": cfg.get("enable_random_table_randomization", True),
         "RANDOM_SEED": cfg.get("random_seed", None),
         "CSV_FILENAME": cfg.get("csv_filename", "names.csv"),
+        "PAIRING_STRATEGY": cfg.get("pairing_strategy", "greedy"),
     }
 
 
@@ -37,23 +79,32 @@ def read_participants_from_csv(filename: str) -> Dict[str, str]:
     participants: Dict[str, str] = {}
 
     with open(filename, newline="", encoding="utf-8") as csvfile:
-        reader = csv.DictReader(csvfile)
-        if not reader.fieldnames:
+        reader = csv.reader(csvfile)
+        fieldnames = next(reader, None)
+        if not fieldnames:
             raise ValueError(f"{filename} has no header row.")
 
         # normalize headers to lower-case
-        field_map = {name.lower(): name for name in reader.fieldnames}
+        header = [name.lower() for name in fieldnames]
 
         required = ["id", "name"]
-        missing = [col for col in required if col not in field_map]
+        missing = [col for col in required if col not in header]
         if missing:
             raise ValueError(
                 f"CSV file must contain columns: {required}, missing: {missing}"
             )
 
+        # resolve column positions once instead of building a dict per row
+        id_i = header.index("id")
+        name_i = header.index("name")
+        min_len = max(id_i, name_i) + 1
+
         for row in reader:
-            pid = row[field_map["id"]].strip()
-            name = row[field_map["name"]].strip()
+            if len(row) < min_len:
+                continue  # blank or truncated row
+
+            pid = row[id_i].strip()
+            name = row[name_i].strip()
 
             if not pid or not name:
                 continue  # skip incomplete rows
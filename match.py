@@ -3,14 +3,77 @@
 from typing import List, Tuple, Dict
 import random
 
+import numpy as np
+
 from config_loader import load_config, read_participants_from_csv
-from output_utils import write_round_to_markdown, print_round_to_console
+from matching_utils import randomize_pairs, scramble_ids
+from output_utils import (
+    markdown_safe_names,
+    print_round_to_console,
+    write_rounds_to_markdown,
+)
 
 
 # =======================
 # ROUND GENERATION
 # =======================
 
+def _circle_indices_numpy(n: int, num_rounds: int) -> np.ndarray:
+    """
+    Circle method in closed form: "others" (ids[1:]) is rotated right by r
+    each round, so position k >= 1 of round r holds ids[(k - 1 - r) % (n - 1) + 1]
+    while position 0 stays fixed. Table i pairs positions i and n - 1 - i.
+    """
+    r = np.arange(num_rounds)[:, None]
+    i = np.arange(n // 2)[None, :]
+    pos1 = np.where(i == 0, 0, (i - 1 - r) % (n - 1) + 1)
+    pos2 = (n - 2 - i - r) % (n - 1) + 1
+    return np.stack([pos1, pos2], axis=-1).astype(np.int32)
+
+
+def _circle_indices_loop(n: int, num_rounds: int) -> np.ndarray:
+    """Same mapping as _circle_indices_numpy, as plain loops for Numba."""
+    out = np.empty((num_rounds, n // 2, 2), dtype=np.int32)
+    for r in range(num_rounds):
+        out[r, 0, 0] = 0
+        for i in range(1, n // 2):
+            out[r, i, 0] = (i - 1 - r) % (n - 1) + 1
+        for i in range(n // 2):
+            out[r, i, 1] = (n - 2 - i - r) % (n - 1) + 1
+    return out
+
+
+# Rosters at least this large use the Numba kernel (if installed). Below it,
+# importing and compiling Numba costs far more than the NumPy version. Even
+# above it the gain is modest: the index table is a small part of
+# generate_rounds, which is dominated by mapping indices back to id tuples.
+NUMBA_MIN_PLAYERS = 2000
+
+_circle_indices_jit = None
+
+
+def _circle_indices(n: int, num_rounds: int) -> np.ndarray:
+    """
+    Schedule index table of shape (num_rounds, n//2, 2): vectorized NumPy,
+    or the Numba-compiled loop for very large rosters. Numba is only
+    imported the first time a large roster needs it.
+    """
+    global _circle_indices_jit
+
+    if n < NUMBA_MIN_PLAYERS:
+        return _circle_indices_numpy(n, num_rounds)
+
+    if _circle_indices_jit is None:
+        try:
+            from numba import njit
+        except ImportError:  # optional; stay on NumPy
+            _circle_indices_jit = _circle_indices_numpy
+        else:
+            _circle_indices_jit = njit(cache=True)(_circle_indices_loop)
+
+    return _circle_indices_jit(n, num_rounds)
+
+
 def generate_rounds(ids: List[str], num_rounds: int) -> List[List[Tuple[str, str]]]:
     """
     Generate up to num_rounds of pairings using the round-robin (circle) method.
@@ -31,97 +94,62 @@ def generate_rounds(ids: List[str], num_rounds: int) -> List[List[Tuple[str, str
             f"Requested {num_rounds} rounds, but maximum with {n} participants is {max_rounds}."
         )
         num_rounds = max_rounds
+    if num_rounds <= 0:
+        return []
 
-    players = list(ids)
-    fixed = players[0]
-    others = players[1:]  # length n-1
-
-    rounds: List[List[Tuple[str, str]]] = []
-
-    for _ in range(num_rounds):
-        current = [fixed] + others
-
-        pairs: List[Tuple[str, str]] = []
-        for i in range(n // 2):
-            p1 = current[i]
-            p2 = current[n - 1 - i]
-            pairs.append((p1, p2))
-
-        rounds.append(pairs)
+    idx = _circle_indices(n, num_rounds)  # (num_rounds, n//2, 2) positions into ids
 
-        # rotate others: move last element to front
-        last = others[-1]
-        others = [last] + others[:-1]
+    ids_arr = np.array(ids, dtype=object)
+    rounds: List[List[Tuple[str, str]]] = [
+        [tuple(pair) for pair in pairs] for pairs in ids_arr[idx].tolist()
+    ]
 
     return rounds
 
 
-# =======================
-# RANDOMIZATION HELPERS
-# =======================
-
-def randomize_pairs(
-    pairs: List[Tuple[str, str]],
-    enable: bool,
-) -> List[Tuple[str, str]]:
-    """
-    Optionally return a randomized copy of the pair list.
-    If enable is False, returns the pairs unchanged.
-    """
-    if not enable:
-        return pairs
-    shuffled = pairs[:]  # shallow copy
-    random.shuffle(shuffled)
-    return shuffled
-
-
-def scramble_ids(ids: List[str]) -> List[str]:
-    """
-    Scramble the order of participant IDs before generating rounds.
-    This ensures CSV order doesn't bias the pairing schedule.
-    """
-    shuffled = ids[:]  # shallow copy so we don't modify the original list
-    random.shuffle(shuffled)
-    return shuffled
-
-
 # =======================
 # MAIN
 # =======================
 
 def main():
-    # Load config from YAML
+    # Load config from TOML
     cfg = load_config()
     num_rounds = cfg["NUM_ROUNDS"]
     enable_random = cfg["ENABLE_RANDOM_TABLE_RANDOMIZATION"]
     random_seed = cfg["RANDOM_SEED"]
     csv_filename = cfg["CSV_FILENAME"]
 
-    if random_seed is not None:
-        random.seed(random_seed)
+    # One generator for the whole run, so a seed fully determines the output
+    rng = random.Random(random_seed)
 
     # Load participants from CSV
     participants: Dict[str, str] = read_participants_from_csv(csv_filename)
     ids = list(participants.keys())
 
     # Scramble the IDs before generating any matchings
-    scrambled_ids = scramble_ids(ids)
+    scrambled_ids = scramble_ids(ids, rng=rng)
 
     # Generate unique pairs per round from scrambled order
     rounds = generate_rounds(scrambled_ids, num_rounds)
 
+    # Escape names for Markdown once rather than per round
+    safe_names = markdown_safe_names(participants)
+
     print(f"Total participants: {len(ids)}")
     print(f"Generated {len(rounds)} rounds of pairings.\n")
 
+    markdown_rounds = []
     for r, pairs in enumerate(rounds, start=1):
         # Optional randomization of table order each round
-        display_pairs = randomize_pairs(pairs, enable_random)
+        display_pairs = randomize_pairs(pairs, enable_random, rng=rng)
 
         # Console output
         print_round_to_console(r, display_pairs, participants)
 
-        # Markdown output
-        write_round_to_markdown(r, display_pairs, participants)
+        markdown_rounds.append((r, display_pairs))
+
+    # Markdown output, all rounds in one batch
+    write_rounds_to_markdown(markdown_rounds, safe_names)
 
     print("Markdown files generated:")
     for r in range(1, len(rounds) + 1):
@@ -0,0 +1,35 @@
+# matching_utils.py
+
+from typing import List, Optional, Tuple
+import random
+
+
+def randomize_pairs(
+    pairs: List[Tuple[str, str]],
+    enable: bool,
+    rng: Optional[random.Random] = None,
+) -> List[Tuple[str, str]]:
+    """
+    Optionally return a randomized copy of the pair list.
+    If enable is False, returns the pairs unchanged.
+
+    rng defaults to the module-level random generator.
+    """
+    if not enable:
+        return pairs
+    sample = rng.sample if rng is not None else random.sample
+    return sample(pairs, len(pairs))
+
+
+def scramble_ids(
+    ids: List[str],
+    rng: Optional[random.Random] = None,
+) -> List[str]:
+    """
+    Scramble the order of participant IDs before generating rounds.
+    This ensures CSV order doesn't bias the pairing schedule.
+
+    rng defaults to the module-level random generator.
+    """
+    sample = rng.sample if rng is not None else random.sample
+    return sample(ids, len(ids))  # new list; the original is untouched
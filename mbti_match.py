@@ -3,14 +3,16 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Set, FrozenSet
+from typing import Dict, List, Tuple
 
-from config_loader import load_config, read_participants_from_csv
-from output_utils import write_round_to_markdown, print_round_to_console
+import numpy as np
 
-# Re-use existing helpers from match.py
-from match import (
-    randomize_pairs,
+from config_loader import load_config, read_participants_from_csv
+from matching_utils import randomize_pairs, scramble_ids
+from output_utils import (
+    markdown_safe_names,
+    print_round_to_console,
+    write_rounds_to_markdown,
 )
 
 
@@ -22,97 +24,187 @@ from match import (
 class Person:
     pid: str       # participant ID
     mbti: str      # MBTI type, e.g. "INTJ", "ENFP"
+    index: int     # position in the roster, used to index PastPairs
+    code: int      # pack_mbti(mbti), computed once; 0 if not a valid type
 
 
 Pair = Tuple[Person, Person]
-PastPairs = Set[FrozenSet[str]]  # frozenset of {id1, id2}
+PastPairs = np.ndarray  # bool[n, n]; past[i, j] is True once i and j have met
+
+MAX_SIMILARITY = 4  # all four MBTI letters match
 
 
 # -----------------------------
 # MBTI similarity + pairing
 # -----------------------------
 
-def mbti_similarity(a: str, b: str) -> int:
+def pack_mbti(mbti: str) -> int:
     """
-    Simple similarity score: how many letters are identical
-    in the same position (0–4).
+    Pack a 4-letter MBTI type into one 32-bit int (one ASCII byte
+    per letter, little-endian). Returns 0 (invalid) if it isn't 4
+    letters or contains non-ASCII characters, which have no
+    one-byte encoding.
     """
-    a = (a or "").upper().strip()
-    b = (b or "").upper().strip()
-    if len(a) != 4 or len(b) != 4:
+    mbti = (mbti or "").upper().strip()
+    if len(mbti) != 4 or not mbti.isascii():
         return 0
+    return int.from_bytes(mbti.encode("ascii"), "little")
 
-    score = 0
-    for ca, cb in zip(a, b):
-        if ca == cb:
-            score += 1
-    return score
+
+def similarity_matrix(codes: np.ndarray) -> np.ndarray:
+    """
+    All-pairs similarity score for an array of pack_mbti codes:
+    how many letters are identical in the same position (0–4),
+    or 0 if either type is invalid. Returns an int8[n, n] matrix.
+    """
+    # Each differing letter leaves a nonzero byte in the XOR
+    x = codes[:, None] ^ codes[None, :]
+    differing = (
+        ((x & 0xFF) != 0).astype(np.int8)
+        + ((x >> 8) & 0xFF != 0)
+        + ((x >> 16) & 0xFF != 0)
+        + ((x >> 24) != 0)
+    )
+    sim = MAX_SIMILARITY - differing
+
+    # Invalid types (code 0) score 0 against everyone
+    invalid = codes == 0
+    sim[invalid, :] = 0
+    sim[:, invalid] = 0
+    return sim
 
 
 def generate_candidate_pairs(
     people: List[Person],
     past_pairs: PastPairs,
-) -> List[Tuple[int, Person, Person]]:
+) -> List[List[Tuple[Person, Person]]]:
     """
-    Generate all allowed (not previously used) pairs with
-    their MBTI similarity scores.
+    Generate all allowed (not previously used) pairs, bucketed
+    by their MBTI similarity score.
 
-    Returns a list of:
-        (similarity_score, person_a, person_b)
-    sorted from most similar to least.
+    The full similarity matrix is computed in one NumPy pass
+    over packed MBTI codes.
+    Since scores only take the values 0-4, pairs are grouped per
+    score instead of sorted.
+
+    Returns:
+        buckets, where buckets[score] is a list of (person_a, person_b)
+        in row-major order.
     """
-    candidates: List[Tuple[int, Person, Person]] = []
+    buckets: List[List[Tuple[Person, Person]]] = [[] for _ in range(MAX_SIMILARITY + 1)]
     n = len(people)
+    if n < 2:
+        return buckets
+
+    codes = np.array([p.code for p in people], dtype=np.uint32)
+    sim = similarity_matrix(codes)
 
-    for i in range(n):
-        for j in range(i + 1, n):
-            p1 = people[i]
-            p2 = people[j]
-            key = frozenset({p1.pid, p2.pid})
-            if key in past_pairs:
-                continue  # skip already-used pairs
+    # Upper triangle only, minus already-used pairs
+    allowed = np.triu(~past_pairs, k=1)
 
-            score = mbti_similarity(p1.mbti, p2.mbti)
-            candidates.append((score, p1, p2))
+    for score in range(MAX_SIMILARITY + 1):
+        rows, cols = np.nonzero(allowed & (sim == score))
+        buckets[score] = [(people[i], people[j]) for i, j in zip(rows.tolist(), cols.tolist())]
+
+    return buckets
+
+
+def greedy_round(
+    people: List[Person],
+    buckets: List[List[Tuple[Person, Person]]],
+) -> List[Pair]:
+    """
+    Pick pairs greedily, most similar first. The default strategy;
+    may leave people unpaired even when a full round exists.
+    """
+    used = [False] * len(people)
+    used_count = 0
+    round_pairs: List[Pair] = []
 
     # Best matches first
-    candidates.sort(key=lambda t: t[0], reverse=True)
-    return candidates
+    for score in range(MAX_SIMILARITY, -1, -1):
+        # If you want to forbid 0-similarity matches entirely, uncomment:
+        # if score == 0:
+        #     break
+
+        for p1, p2 in buckets[score]:
+            if used[p1.index] or used[p2.index]:
+                continue
+
+            round_pairs.append((p1, p2))
+            used[p1.index] = used[p2.index] = True
+            used_count += 2
+
+        # Nobody left to pair; skip the remaining buckets
+        if used_count >= len(people) - 1:
+            break
+
+    return round_pairs
+
+
+def matching_round(
+    people: List[Person],
+    buckets: List[List[Tuple[Person, Person]]],
+) -> List[Pair]:
+    """
+    Pick pairs as a maximum-weight matching (blossom algorithm) on
+    the allowed pairs, weighted by similarity: as many people as
+    possible are paired, and among those rounds the total similarity
+    is maximal.
+
+    Pairs are returned most similar first, like greedy_round.
+    Opt-in via pairing_strategy = "matching"; needs networkx and is
+    much slower than greedy_round (pure-Python blossom).
+    """
+    try:
+        import networkx as nx
+    except ImportError as e:
+        raise RuntimeError(
+            'pairing_strategy "matching" requires the networkx package.'
+        ) from e
+
+    G = nx.Graph()
+    for score, bucket in enumerate(buckets):
+        G.add_edges_from(((p1.index, p2.index) for p1, p2 in bucket), weight=score)
+
+    matched = [
+        (min(i, j), max(i, j))
+        for i, j in nx.max_weight_matching(G, maxcardinality=True)
+    ]
+    matched.sort(key=lambda ij: (-G.edges[ij]["weight"], ij))
+    return [(people[i], people[j]) for i, j in matched]
+
+
+PAIRING_STRATEGIES = {
+    "greedy": greedy_round,
+    "matching": matching_round,
+}
 
 
 def build_round(
     people: List[Person],
     past_pairs: PastPairs,
+    strategy: str = "greedy",
 ) -> Tuple[List[Pair], List[Person]]:
     """
     Build a single round of matches using MBTI similarity,
     without reusing any pair in past_pairs and without using
     any person more than once in this round.
 
+    strategy is a key of PAIRING_STRATEGIES.
+
     Returns:
         (pairs_for_this_round, leftover_people)
     """
     if len(people) < 2:
         return [], people[:]
 
-    candidates = generate_candidate_pairs(people, past_pairs)
+    buckets = generate_candidate_pairs(people, past_pairs)
 
-    used_ids: Set[str] = set()
-    round_pairs: List[Pair] = []
+    round_pairs = PAIRING_STRATEGIES[strategy](people, buckets)
 
-    for score, p1, p2 in candidates:
-        # If you want to forbid 0-similarity matches entirely, uncomment:
-        # if score == 0:
-        #     break
-
-        if p1.pid in used_ids or p2.pid in used_ids:
-            continue
-
-        round_pairs.append((p1, p2))
-        used_ids.add(p1.pid)
-        used_ids.add(p2.pid)
-
-    leftovers = [p for p in people if p.pid not in used_ids]
+    used = {p.index for pair in round_pairs for p in pair}
+    leftovers = [p for p in people if p.index not in used]
     return round_pairs, leftovers
 
 
@@ -121,12 +213,11 @@ def update_past_pairs(
     new_pairs: List[Pair],
 ) -> PastPairs:
     """
-    Add newly-created pairs to the historical set.
+    Mark newly-created pairs in the history matrix (in place).
     """
-    updated = set(past_pairs)
     for p1, p2 in new_pairs:
-        updated.add(frozenset({p1.pid, p2.pid}))
-    return updated
+        past_pairs[p1.index, p2.index] = past_pairs[p2.index, p1.index] = True
+    return past_pairs
 
 
 # -----------------------------
@@ -137,6 +228,7 @@ def generate_rounds(
     scrambled_ids: List[str],
     num_rounds: int,
     participants: Dict[str, str],
+    strategy: str = "greedy",
 ) -> List[List[Tuple[str, str]]]:
     """
     MBTI-based version of generate_rounds.
@@ -144,6 +236,7 @@ def generate_rounds(
     - scrambled_ids: list of participant IDs (already shuffled if desired).
     - num_rounds: how many rounds to generate.
     - participants: mapping id -> mbti (or id -> some string containing MBTI).
+    - strategy: "greedy" (default) or "matching", see PAIRING_STRATEGIES.
 
     Returns:
         List of rounds, where each round is a list of (id1, id2) tuples.
@@ -152,17 +245,24 @@ def generate_rounds(
     - No pair (id1, id2) is repeated across rounds in this run.
     - Within a given round, each id appears at most once.
     """
+    if strategy not in PAIRING_STRATEGIES:
+        raise ValueError(
+            f"Unknown pairing strategy {strategy!r}, "
+            f"expected one of: {sorted(PAIRING_STRATEGIES)}"
+        )
+
     # Build Person list in the order of scrambled_ids
-    people: List[Person] = [
-        Person(pid=pid, mbti=str(participants.get(pid, "")).strip())
-        for pid in scrambled_ids
-    ]
+    people: List[Person] = []
+    for k, pid in enumerate(scrambled_ids):
+        mbti = str(participants.get(pid, "")).strip()
+        people.append(Person(pid=pid, mbti=mbti, index=k, code=pack_mbti(mbti)))
 
     rounds: List[List[Tuple[str, str]]] = []
-    past_pairs: PastPairs = set()
+    n = len(people)
+    past_pairs: PastPairs = np.zeros((n, n), dtype=bool)
 
     for _ in range(num_rounds):
-        pairs_this_round, _leftovers = build_round(people, past_pairs)
+        pairs_this_round, _leftovers = build_round(people, past_pairs, strategy)
 
         # If no new pairs can be created without repeats, stop early.
         if not pairs_this_round:
@@ -183,39 +283,47 @@ def generate_rounds(
 # -----------------------------
 
 def main() -> None:
-    # Load config from YAML
+    # Load config from TOML
     cfg = load_config()
     num_rounds = cfg["NUM_ROUNDS"]
     enable_random = cfg["ENABLE_RANDOM_TABLE_RANDOMIZATION"]
     random_seed = cfg["RANDOM_SEED"]
     csv_filename = cfg["CSV_FILENAME"]
+    strategy = cfg["PAIRING_STRATEGY"]
 
     # Load participants from CSV
     # Assumption: participants is Dict[str, str] where value includes or is MBTI.
     participants: Dict[str, str] = read_participants_from_csv(csv_filename)
     ids = list(participants.keys())
 
+    # One generator for the whole run, so a seed fully determines the output
+    rng = random.Random(random_seed)
+
     # Optional initial scrambling, same idea as match.py
-    scrambled_ids = ids[:]
-    if enable_random:
-        random.seed(random_seed)
-        random.shuffle(scrambled_ids)
+    scrambled_ids = scramble_ids(ids, rng=rng) if enable_random else ids
 
     # Generate rounds using MBTI similarity & no repeated pairs
-    rounds = generate_rounds(scrambled_ids, num_rounds, participants)
+    rounds = generate_rounds(scrambled_ids, num_rounds, participants, strategy)
+
+    # Escape names for Markdown once rather than per round
+    safe_names = markdown_safe_names(participants)
 
     print(f"Total participants: {len(ids)}")
+    print(f"Pairing strategy: {strategy}")
     print(f"Generated {len(rounds)} rounds of pairings.\n")
 
+    markdown_rounds = []
     for r, pairs in enumerate(rounds, start=1):
         # Optional randomization of table order each round
-        display_pairs = randomize_pairs(pairs, enable_random)
+        display_pairs = randomize_pairs(pairs, enable_random, rng=rng)
 
         # Console output
         print_round_to_console(r, display_pairs, participants)
 
-        # Markdown output
-        write_round_to_markdown(r, display_pairs, participants)
+        markdown_rounds.append((r, display_pairs))
+
+    # Markdown output, all rounds in one batch
+    write_rounds_to_markdown(markdown_rounds, safe_names)
 
 
 if __name__ == "__main__":
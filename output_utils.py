@@ -1,36 +1,69 @@
 # output_utils.py
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 from pathlib import Path
+import io
+import sys
+
+
+def markdown_safe_names(participants: Dict[str, str]) -> Dict[str, str]:
+    """
+    Escape '|' in every name once, so names can be dropped straight
+    into Markdown table cells for every round.
+    """
+    return {pid: name.replace("|", "\\|") for pid, name in participants.items()}
 
 
 def write_round_to_markdown(
     round_index: int,
     pairs: List[Tuple[str, str]],
-    participants: Dict[str, str],
+    safe_names: Dict[str, str],
 ) -> None:
     """
     Write one round of pairings to a Markdown file named round_<n>.md.
-    If the file exists, it is overwritten.
+    If the file exists, it is overwritten (write_text truncates it).
 
-    pairs are (id1, id2), participants maps id -> name
+    pairs are (id1, id2), safe_names maps id -> name already escaped
+    with markdown_safe_names (raw names are written as-is)
     """
     filename = Path(f"round_{round_index}.md")
-    if filename.exists():
-        filename.unlink()
 
-    lines = []
-    lines.append(f"# Round {round_index}\n")
-    lines.append("| Table # | Name 1 | Name 2 |")
-    lines.append("|--------:|--------|--------|")
+    out = io.StringIO()
+    out.write(f"# Round {round_index}\n\n")
+    out.write("| Table # | Name 1 | Name 2 |\n")
+    out.write("|--------:|--------|--------|\n")
+
+    # Bind the per-row callables once, outside the loop
+    name_of = safe_names.__getitem__
+    write = out.write
+    row_fmt = "| {} | {} | {} |\n".format
 
     for table_num, (id1, id2) in enumerate(pairs, start=1):
-        name1 = participants[id1].replace("|", "\\|")
-        name2 = participants[id2].replace("|", "\\|")
-        lines.append(f"| {table_num} | {name1} | {name2} |")
+        write(row_fmt(table_num, name_of(id1), name_of(id2)))
 
-    content = "\n".join(lines) + "\n"
-    filename.write_text(content, encoding="utf-8")
+    filename.write_text(out.getvalue(), encoding="utf-8")
+
+
+def write_rounds_to_markdown(
+    rounds: List[Tuple[int, List[Tuple[str, str]]]],
+    safe_names: Dict[str, str],
+    max_workers: int = 8,
+) -> None:
+    """
+    Write several rounds at once, one round_<n>.md per (round_index, pairs).
+    safe_names comes from markdown_safe_names, as for write_round_to_markdown.
+
+    Files are independent, so they are written from a thread pool
+    (file I/O releases the GIL). Any write error is re-raised here.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        futures = [
+            ex.submit(write_round_to_markdown, round_index, pairs, safe_names)
+            for round_index, pairs in rounds
+        ]
+        for future in futures:
+            future.result()
 
 
 def print_round_to_console(
@@ -40,15 +73,22 @@ def print_round_to_console(
 ) -> None:
     """
     Pretty-print one round to the console in a table format.
+    The whole round is emitted with a single write.
     """
-    print(f"Round {round_index}:")
-    print("-" * 60)
-    print(f"{'Table #':<8} {'Name 1':<24} {'Name 2':<24}")
-    print("-" * 60)
+    lines = [
+        f"Round {round_index}:",
+        "-" * 60,
+        f"{'Table #':<8} {'Name 1':<24} {'Name 2':<24}",
+        "-" * 60,
+    ]
+
+    # Bind the per-row callables once, outside the loop
+    name_of = participants.__getitem__
+    append = lines.append
+    row_fmt = "{:<8} {:<24} {:<24}".format
 
     for table_num, (id1, id2) in enumerate(pairs, start=1):
-        name1 = participants[id1]
-        name2 = participants[id2]
-        print(f"{table_num:<8} {name1:<24} {name2:<24}")
+        append(row_fmt(table_num, name_of(id1), name_of(id2)))
 
-    print()  # blank line between rounds
+    lines.append("")  # blank line between rounds
+    sys.stdout.write("\n".join(lines) + "\n")
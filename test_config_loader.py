@@ -0,0 +1,35 @@
+# test_config_loader.py
+
+import pytest
+
+import config_loader
+from config_loader import load_config
+
+
+def test_toml_config(tmp_path):
+    path = tmp_path / "config.toml"
+    path.write_text('num_rounds = 3\ncsv_filename = "people.csv"\n', encoding="utf-8")
+
+    cfg = load_config(str(path))
+    assert cfg["NUM_ROUNDS"] == 3
+    assert cfg["CSV_FILENAME"] == "people.csv"
+    assert cfg["RANDOM_SEED"] is None
+
+
+def test_falls_back_to_yaml_without_toml_parser(tmp_path, monkeypatch):
+    pytest.importorskip("yaml")
+    monkeypatch.setattr(config_loader, "tomllib", None)
+    (tmp_path / "config.toml").write_text("num_rounds = 3\n", encoding="utf-8")
+    (tmp_path / "config.yaml").write_text("num_rounds: 2\nrandom_seed: 7\n", encoding="utf-8")
+
+    cfg = load_config(str(tmp_path / "config.toml"))
+    assert cfg["NUM_ROUNDS"] == 2
+    assert cfg["RANDOM_SEED"] == 7
+
+
+def test_no_toml_parser_and_no_yaml_raises(tmp_path, monkeypatch):
+    monkeypatch.setattr(config_loader, "tomllib", None)
+    (tmp_path / "config.toml").write_text("num_rounds = 3\n", encoding="utf-8")
+
+    with pytest.raises(RuntimeError, match="config.yaml"):
+        load_config(str(tmp_path / "config.toml"))
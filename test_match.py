@@ -0,0 +1,46 @@
+# test_match.py
+
+import numpy as np
+import pytest
+
+import match
+from match import _circle_indices_loop, _circle_indices_numpy, generate_rounds
+
+
+@pytest.mark.parametrize("n", [2, 4, 6, 10, 32, 202])
+def test_circle_index_kernels_agree(n):
+    # The Numba kernel compiles _circle_indices_loop; keep it in step
+    # with the NumPy closed form.
+    for num_rounds in (0, 1, 3, n - 1):
+        loop = _circle_indices_loop(n, num_rounds)
+        vectorized = _circle_indices_numpy(n, num_rounds)
+        assert loop.shape == vectorized.shape == (num_rounds, n // 2, 2)
+        assert np.array_equal(loop, vectorized)
+
+
+@pytest.mark.parametrize("n", [2, 4, 10, 32])
+def test_numba_kernel_matches_numpy(n, monkeypatch):
+    pytest.importorskip("numba")
+    # Route even small rosters through the jitted kernel
+    monkeypatch.setattr(match, "NUMBA_MIN_PLAYERS", 0)
+    monkeypatch.setattr(match, "_circle_indices_jit", None)
+
+    for num_rounds in (0, 1, 3, n - 1):
+        jitted = match._circle_indices(n, num_rounds)
+        assert match._circle_indices_jit is not _circle_indices_numpy
+        assert jitted.dtype == np.int32
+        assert np.array_equal(jitted, _circle_indices_numpy(n, num_rounds))
+
+
+def test_generate_rounds_has_no_repeated_pairs():
+    ids = [str(k) for k in range(12)]
+    rounds = generate_rounds(ids, len(ids) - 1)
+
+    seen = set()
+    for pairs in rounds:
+        assert sorted(p for pair in pairs for p in pair) == sorted(ids)
+        for pair in pairs:
+            key = frozenset(pair)
+            assert key not in seen
+            seen.add(key)
+    assert len(seen) == len(ids) * (len(ids) - 1) // 2
@@ -0,0 +1,77 @@
+# test_mbti_match.py
+
+import random
+import sys
+
+import numpy as np
+import pytest
+
+from mbti_match import generate_rounds, pack_mbti, similarity_matrix
+
+
+def test_similarity_matrix_counts_matching_letters():
+    types = ["INTJ", "intj", "ENFP", "ISTP", " infj ", "bad", ""]
+    sim = similarity_matrix(np.array([pack_mbti(t) for t in types], dtype=np.uint32))
+
+    for i, a in enumerate(types):
+        for j, b in enumerate(types):
+            a_n, b_n = a.strip().upper(), b.strip().upper()
+            expected = (
+                sum(x == y for x, y in zip(a_n, b_n))
+                if len(a_n) == 4 and len(b_n) == 4
+                else 0
+            )
+            assert sim[i, j] == expected
+
+
+def test_non_ascii_types_are_invalid():
+    assert pack_mbti("INTé") == 0
+    assert pack_mbti("INTü") == 0
+
+    sim = similarity_matrix(np.array([pack_mbti("INTé"), pack_mbti("INTü")], dtype=np.uint32))
+    assert sim[0, 1] == 0
+
+
+def make_roster(size, seed):
+    rng = random.Random(seed)
+    letters = ("IE", "NS", "TF", "JP")
+    return {str(k): "".join(rng.choice(pair) for pair in letters) for k in range(size)}
+
+
+def assert_valid_schedule(rounds, ids):
+    seen = set()
+    for pairs in rounds:
+        people = [pid for pair in pairs for pid in pair]
+        assert len(people) == len(set(people))
+        for pair in pairs:
+            key = frozenset(pair)
+            assert key not in seen
+            seen.add(key)
+        assert set(people) <= set(ids)
+
+
+def test_matching_fills_every_round():
+    pytest.importorskip("networkx")
+    roster = make_roster(20, seed=0)
+    ids = list(roster)
+
+    greedy = generate_rounds(ids, 8, roster)
+    matching = generate_rounds(ids, 8, roster, strategy="matching")
+
+    assert_valid_schedule(greedy, ids)
+    assert_valid_schedule(matching, ids)
+    assert min(len(pairs) for pairs in greedy) == 8
+    assert [len(pairs) for pairs in matching] == [10] * 8
+
+
+def test_unknown_strategy_raises():
+    roster = make_roster(4, seed=0)
+    with pytest.raises(ValueError, match="Unknown pairing strategy"):
+        generate_rounds(list(roster), 1, roster, strategy="blossom")
+
+
+def test_matching_without_networkx_raises(monkeypatch):
+    monkeypatch.setitem(sys.modules, "networkx", None)
+    roster = make_roster(4, seed=0)
+    with pytest.raises(RuntimeError, match="networkx"):
+        generate_rounds(list(roster), 1, roster, strategy="matching")
@@ -0,0 +1,48 @@
+# test_verify_matches.py
+
+import pytest
+
+from verify_matches import PAIR_LINE_PATTERNS, match_pair, normalize_id
+
+
+def match_pair_one_by_one(line):
+    # Reference: try each pattern in turn, as before the combined regex
+    for pattern in PAIR_LINE_PATTERNS:
+        m = pattern.match(line)
+        if not m:
+            continue
+        id1, id2 = normalize_id(m.group(1)), normalize_id(m.group(2))
+        if id1 and id2:
+            return id1, id2
+    return None
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "| 1 | Alice | Bob |",
+        "| Alice | Bob |",
+        "|--------:|--------|--------|",
+        "| 3 |  | Bob |",
+        "- alice & bob",
+        "* Al VS Bo",
+        "- alice | bob",
+        "alice - bob",
+        "# Round 1",
+        "just text",
+        # bullet matches with a blank first id, then falls through to "a - b"
+        "* \t-SS",
+        "*  -\taS 1",
+        "-  & bob",
+    ],
+)
+def test_combined_pattern_matches_one_by_one(line):
+    assert match_pair(line) == match_pair_one_by_one(line)
+
+
+def test_blank_id_falls_through_to_later_pattern():
+    assert match_pair("* \t-SS") == ("*", "SS")
+
+
+def test_each_pattern_has_two_groups():
+    assert all(p.groups == 2 for p in PAIR_LINE_PATTERNS)
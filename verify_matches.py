@@ -6,7 +6,8 @@ import os
 import re
 import sys
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Set, FrozenSet, Iterable
+from multiprocessing import Pool
+from typing import Dict, List, Tuple, Iterable
 
 
 # -------------------------------------------------------------------
@@ -31,6 +32,18 @@ PAIR_LINE_PATTERNS = [
     ),
 ]
 
+# All of the above as one alternation, tried in the same order, so each
+# line costs a single match() call. Every pattern has exactly two groups,
+# so pattern k owns groups 2k+1 and 2k+2.
+assert all(p.groups == 2 for p in PAIR_LINE_PATTERNS), "each pattern needs exactly 2 groups"
+
+PAIR_LINE_PATTERN = re.compile(
+    "|".join(
+        f"(?i:{p.pattern})" if p.flags & re.IGNORECASE else f"(?:{p.pattern})"
+        for p in PAIR_LINE_PATTERNS
+    )
+)
+
 
 @dataclass(frozen=True)
 class PairOccurrence:
@@ -41,6 +54,9 @@ class PairOccurrence:
     line_text: str
 
 
+PairKey = Tuple[str, str]  # (id1, id2) with id1 <= id2
+
+
 # -------------------------------------------------------------------
 # Parsing logic
 # -------------------------------------------------------------------
@@ -49,6 +65,31 @@ def normalize_id(raw: str) -> str:
     return raw.strip()
 
 
+def match_pair(line: str) -> Tuple[str, str] | None:
+    m = PAIR_LINE_PATTERN.match(line)
+    if not m:
+        return None
+
+    k = m.lastindex // 2 - 1  # which of PAIR_LINE_PATTERNS matched
+    id1 = normalize_id(m.group(2 * k + 1))
+    id2 = normalize_id(m.group(2 * k + 2))
+    if id1 and id2:
+        return id1, id2
+
+    # A blank id falls through to the later patterns, one at a time
+    for pattern in PAIR_LINE_PATTERNS[k + 1:]:
+        m = pattern.match(line)
+        if not m:
+            continue
+
+        id1 = normalize_id(m.group(1))
+        id2 = normalize_id(m.group(2))
+        if id1 and id2:
+            return id1, id2
+
+    return None
+
+
 def iter_pairs_in_file(path: str) -> Iterable[PairOccurrence]:
     with open(path, encoding="utf-8") as f:
         for lineno, line in enumerate(f, start=1):
@@ -56,30 +97,33 @@ def iter_pairs_in_file(path: str) -> Iterable[PairOccurrence]:
             if not stripped:
                 continue
 
-            for pattern in PAIR_LINE_PATTERNS:
-                m = pattern.match(stripped)
-                if not m:
-                    continue
+            ids = match_pair(stripped)
+            if ids is None:
+                continue
 
-                raw1, raw2 = m.group(1), m.group(2)
-                id1 = normalize_id(raw1)
-                id2 = normalize_id(raw2)
+            yield PairOccurrence(
+                person1=ids[0],
+                person2=ids[1],
+                filename=os.path.basename(path),
+                line_number=lineno,
+                line_text=stripped,
+            )
 
-                if not id1 or not id2:
-                    continue
 
-                yield PairOccurrence(
-                    person1=id1,
-                    person2=id2,
-                    filename=os.path.basename(path),
-                    line_number=lineno,
-                    line_text=stripped,
-                )
-                break
+# Below this many files, collect_pairs parses serially unless --jobs is given
+POOL_MIN_FILES = 64
+
 
+def parse_file(path: str) -> List[PairOccurrence]:
+    return list(iter_pairs_in_file(path))
 
-def collect_pairs(root_dir: str, pattern: str = ".md") -> Dict[FrozenSet[str], List[PairOccurrence]]:
-    all_pairs: Dict[FrozenSet[str], List[PairOccurrence]] = {}
+
+def collect_pairs(
+    root_dir: str,
+    pattern: str = ".md",
+    jobs: int | None = None,
+) -> Dict[PairKey, List[PairOccurrence]]:
+    paths: List[str] = []
 
     for dirpath, _dirnames, filenames in os.walk(root_dir):
         for name in filenames:
@@ -92,10 +136,29 @@ def collect_pairs(root_dir: str, pattern: str = ".md") -> Dict[FrozenSet[str], L
             if not name.endswith(pattern):
                 continue
 
-            full_path = os.path.join(dirpath, name)
-            for occ in iter_pairs_in_file(full_path):
-                key = frozenset({occ.person1, occ.person2})
-                all_pairs.setdefault(key, []).append(occ)
+            paths.append(os.path.join(dirpath, name))
+
+    # Files are independent, so large trees are parsed in worker processes;
+    # a pool costs more than it saves on a handful of files. An explicit
+    # jobs > 1 always uses the pool. imap keeps file order, so the report
+    # stays deterministic.
+    if jobs is None:
+        use_pool = len(paths) >= POOL_MIN_FILES and (os.cpu_count() or 1) > 1
+    else:
+        use_pool = jobs > 1 and len(paths) > 1
+
+    if not use_pool:
+        results = [parse_file(path) for path in paths]
+    else:
+        with Pool(jobs) as pool:
+            results = list(pool.imap(parse_file, paths, chunksize=16))
+
+    all_pairs: Dict[PairKey, List[PairOccurrence]] = {}
+    for occs in results:
+        for occ in occs:
+            id1, id2 = occ.person1, occ.person2
+            key = (id1, id2) if id1 <= id2 else (id2, id1)
+            all_pairs.setdefault(key, []).append(occ)
 
     return all_pairs
 
@@ -104,12 +167,12 @@ def collect_pairs(root_dir: str, pattern: str = ".md") -> Dict[FrozenSet[str], L
 # Duplicate detection
 # -------------------------------------------------------------------
 
-def find_duplicates(all_pairs: Dict[FrozenSet[str], List[PairOccurrence]]) -> Dict[FrozenSet[str], List[PairOccurrence]]:
+def find_duplicates(all_pairs: Dict[PairKey, List[PairOccurrence]]) -> Dict[PairKey, List[PairOccurrence]]:
     return {k: v for k, v in all_pairs.items() if len(v) > 1}
 
 
 def print_report(
-    duplicates: Dict[FrozenSet[str], List[PairOccurrence]],
+    duplicates: Dict[PairKey, List[PairOccurrence]],
     verbose: bool = True,
 ) -> None:
     if not duplicates:
@@ -118,12 +181,8 @@ def print_report(
 
     print("❌ Duplicate matches detected!\n")
 
-    for pair_key, occs in sorted(
-        duplicates.items(),
-        key=lambda kv: sorted(list(kv[0]))
-    ):
-        ids = sorted(list(pair_key))
-        print(f"Pair: {ids[0]}  ↔  {ids[1]}  (seen {len(occs)} times)")
+    for pair_key, occs in sorted(duplicates.items()):
+        print(f"Pair: {pair_key[0]}  ↔  {pair_key[1]}  (seen {len(occs)} times)")
         if verbose:
             for occ in occs:
                 print(
@@ -152,6 +211,15 @@ def parse_args(argv: List[str] | None = None) -> argparse.Namespace:
         default=".md",
         help="Markdown file extension (default: .md)"
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help=(
+            "Worker processes for parsing files (default: serial for small "
+            "trees, CPU count for large ones; 1 = no pool)."
+        )
+    )
     parser.add_argument(
         "--quiet",
         action="store_true",
@@ -168,7 +236,7 @@ def main(argv: List[str] | None = None) -> None:
         print(f"Error: '{root_dir}' is not a directory.", file=sys.stderr)
         sys.exit(1)
 
-    all_pairs = collect_pairs(root_dir, pattern=args.ext)
+    all_pairs = collect_pairs(root_dir, pattern=args.ext, jobs=args.jobs)
     duplicates = find_duplicates(all_pairs)
 
     print_report(duplicates, verbose=not args.quiet)